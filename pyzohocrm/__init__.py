@@ -1,2 +1,4 @@
 from .api import ZohoApi
-from .token_manager import TokenManager
\ No newline at end of file
+from .async_api import AsyncZohoApi
+from .token_manager import TokenManager, get_token_manager
+from .rate_limiter import RateLimiter
@@ -1,40 +1,158 @@
 import os
 import logging
+import time
 import requests
+from itertools import islice
+from requests.adapters import HTTPAdapter
+from requests_toolbelt import MultipartEncoder
 from typing import Literal
 from .utils import *
+from .rate_limiter import RateLimiter, RETRY_STATUS_CODES
+from .token_manager import TokenManager
 
-class ZohoApi():
+# Zoho CRM accepts at most 100 records in a single insert/update call
+MAX_RECORDS_PER_REQUEST = 100
+
+class _ZohoApiBase():
+    """
+    The client state, URL building and argument validation shared by `ZohoApi` and `AsyncZohoApi`.
+
+    Attributes:
+        base_url (str): The base URL for the Zoho CRM API.
+        logger (logging.Logger): Logger instance for logging API events and errors.
+        rate_limiter (RateLimiter): The throttle applied to every request.
+        token_manager (TokenManager): Supplies the access token for calls made without an explicit `token`.
+    """
+
+    def __init__(self, base_url: str, rate_limiter: RateLimiter = None, token_manager: TokenManager = None) -> None:
+        self.base_url = base_url
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.token_manager = token_manager
+        self._mod_url_cache = {}
+        self.logger = logging.getLogger(type(self).__module__)
+        self.logger.setLevel(logging.INFO)
+
+    def _module_url(self, moduleName: str) -> str:
+        """
+        Returns the endpoint URL of a Zoho CRM module, built once per module name.
+
+        Args:
+            moduleName (str): The name of the Zoho CRM module.
+
+        Returns:
+            str: The module URL.
+        """
+        url = self._mod_url_cache.get(moduleName)
+        if url is None:
+            url = self._mod_url_cache[moduleName] = f"{self.base_url}/{moduleName}"
+        return url
+
+    def _attachments_url(self, moduleName: str, record_id: str) -> str:
+        """
+        Returns the attachments endpoint URL of a record.
+        """
+        return f"{self._module_url(moduleName)}/{record_id}/Attachments"
+
+    def _fetch_file_url(self, moduleName: str, record_id: str, file_id: str, token: str, fetch_all: bool) -> str:
+        """
+        Validates the arguments of `fetch_file` and returns the URL to fetch.
+
+        Raises:
+            ValueError: If `record_id` is missing, no token is available, or `file_id` is missing when `fetch_all` is False.
+        """
+        if not record_id:
+            raise ValueError("record_id is required.")
+
+        if not token and self.token_manager is None:
+            raise ValueError("token is required.")
+
+        if not fetch_all and not file_id:
+            raise ValueError("file_id must be provided when fetch_all is False.")
+
+        url = self._attachments_url(moduleName, record_id)
+        return url if fetch_all else f"{url}/{file_id}"
+
+    def _related_list_url(self, moduleName: str, record_id: str, token: str, name: str) -> str:
+        """
+        Validates the arguments of `fetch_related_list` and returns the URL to fetch.
+
+        Raises:
+            ValueError: If `record_id` is missing, no token is available, or `name` is missing.
+        """
+        if not record_id:
+            raise ValueError("record_id is required.")
+
+        if not token and self.token_manager is None:
+            raise ValueError("token is required.")
+
+        if not name:
+            raise ValueError("name is required.")
+
+        return f"{self._module_url(moduleName)}/{record_id}/{name}"
+
+
+class ZohoApi(_ZohoApiBase):
     """
     A utility class to interact with the Zoho CRM API. This class provides methods to perform CRUD operations
     and manage attachments for Zoho CRM modules.
 
+    All requests share a single `requests.Session`, so connections to the Zoho host are kept alive and
+    pooled across calls. Reuse one instance for many operations and close it when done, either with
+    `close()` or by using the instance as a context manager.
+
+    Requests are throttled by a `RateLimiter`, and requests rejected with 429 or 503 are retried with
+    exponential backoff.
+
     Attributes:
         base_url (str): The base URL for the Zoho CRM API.
         logger (logging.Logger): Logger instance for logging API events and errors.
+        rate_limiter (RateLimiter): The throttle applied to every request.
+        token_manager (TokenManager): Supplies the access token for calls made without an explicit `token`.
     """
 
-    def __init__(self, base_url: str) -> None:
+    def __init__(self, base_url: str, rate_limiter: RateLimiter = None, token_manager: TokenManager = None) -> None:
         """
         Initializes the ZohoApi class with the given base URL.
 
         Args:
             base_url (str): The base URL of the Zoho CRM API.
+            rate_limiter (RateLimiter, optional): The throttle to use. Defaults to a `RateLimiter` that only reacts to throttled responses.
+            token_manager (TokenManager, optional): The token source for calls made without a `token`. Pass the
+                same instance, e.g. from `get_token_manager`, to every client so they share one token.
         """
-        self.base_url = base_url
-        self.logger = logging.getLogger(__name__)
-        self.logger.setLevel(logging.INFO)
+        super().__init__(base_url, rate_limiter, token_manager)
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+
+    def close(self) -> None:
+        """
+        Closes the underlying HTTP session and releases pooled connections.
+        """
+        self._session.close()
 
-    def _make_request(self, method: Literal["GET", "POST", "PUT", "DELETE", "PATCH"], url: str, json=None,data=None, files=None, params=None, token=None) -> requests.Response:
+    def __enter__(self) -> "ZohoApi":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _make_request(self, method: Literal["GET", "POST", "PUT", "DELETE", "PATCH"], url: str, json=None,data=None, files=None, params=None, token=None, headers=None) -> requests.Response:
         """
         Makes an HTTP request to the Zoho CRM API.
 
+        The request waits for the rate limiter before it is sent. If the API answers with 429 or 503, the
+        request is retried after the Retry-After delay or an exponential backoff, up to
+        `rate_limiter.max_attempts` attempts. File uploads and streamed bodies are sent only once, since they
+        cannot be replayed.
+
         Args:
             method (Literal): The HTTP method (e.g., GET, POST, PUT, DELETE, PATCH).
             url (str): The full API endpoint URL.
-            data (dict, optional): The JSON payload for the request.
+            json (dict, optional): The JSON payload for the request, serialized with orjson when available.
+            data (dict, optional): The form payload for the request.
             files (dict, optional): Files to be uploaded.
-            token (str, optional): Authorization token.
+            token (str, optional): Authorization token. Defaults to the token manager's current token.
+            headers (dict, optional): Extra headers merged over the authorization headers.
 
         Returns:
             requests.Response: The response object from the API request.
@@ -44,7 +162,31 @@ class ZohoApi():
             Exception: For any unexpected errors.
         """
         try:
-            response = requests.request(method, url, headers=get_header(token=token), json=json, data=data, files=files, params=params)
+            if not token and self.token_manager is not None:
+                token = self.token_manager.get_access_token()
+            if json is not None and data is None and files is None:
+                # Serialize up front so requests sends the bytes as is instead of running stdlib json
+                data, json = json_dumps(json), None
+                request_headers = get_json_header(token)
+            else:
+                request_headers = get_header(token=token)
+            if headers:
+                request_headers = {**request_headers, **headers}
+            replayable = files is None and not hasattr(data, "read")
+            max_attempts = self.rate_limiter.max_attempts if replayable else 1
+            for attempt in range(max_attempts):
+                self.rate_limiter.acquire()
+                try:
+                    response = self._session.request(method, url, headers=request_headers, json=json, data=data, files=files, params=params)
+                except Exception:
+                    self.rate_limiter.release()
+                    raise
+                self.rate_limiter.release(response.status_code, response.headers)
+                if response.status_code not in RETRY_STATUS_CODES or attempt == max_attempts - 1:
+                    break
+                delay = self.rate_limiter.backoff_delay(attempt, response.headers.get("Retry-After"))
+                self.logger.warning(f"Request throttled with status {response.status_code}, retrying in {delay:.1f}s")
+                time.sleep(delay)
             response.raise_for_status()
             return response
         except requests.RequestException as e:
@@ -66,7 +208,7 @@ class ZohoApi():
         Returns:
             requests.Response: The response object.
         """
-        url = f"{self.base_url}/{moduleName}"
+        url = self._module_url(moduleName)
         return self._make_request("POST", url, json=data, token=token)
 
     def read_record(self, moduleName: str, id: str = None, token: str = None) -> requests.Response:
@@ -81,9 +223,8 @@ class ZohoApi():
         Returns:
             requests.Response: The response object.
         """
-        url = f"{self.base_url}/{moduleName}"
-        if id:
-            url += f"/{id}"
+        module_url = self._module_url(moduleName)
+        url = f"{module_url}/{id}" if id else module_url
         return self._make_request("GET", url, token=token)
 
     def fetch_module_data(self, moduleName: str, token: str = None) -> requests.Response:
@@ -97,7 +238,7 @@ class ZohoApi():
         Returns:
             requests.Response: The response object.
         """
-        url = f"{self.base_url}/{moduleName}"
+        url = self._module_url(moduleName)
         return self._make_request("GET", url, token=token)
 
     def update_record(self, moduleName: str, id: str, data: dict, token: str = None) -> requests.Response:
@@ -113,7 +254,7 @@ class ZohoApi():
         Returns:
             requests.Response: The response object.
         """
-        url = f"{self.base_url}/{moduleName}/{id}"
+        url = f"{self._module_url(moduleName)}/{id}"
         return self._make_request("PUT", url, json=data, token=token)
 
     def patch_record(self, moduleName: str, id: str, data: dict, token: str = None) -> requests.Response:
@@ -129,9 +270,33 @@ class ZohoApi():
         Returns:
             requests.Response: The response object.
         """
-        url = f"{self.base_url}/{moduleName}/{id}"
+        url = f"{self._module_url(moduleName)}/{id}"
         return self._make_request("PATCH", url, json={"data": [data]}, token=token)
 
+    def patch_records(self, moduleName: str, records: list, token: str = None) -> list:
+        """
+        Partially updates multiple records in the specified Zoho CRM module.
+
+        The records are sent in batches of up to 100 per request instead of one request per record. The
+        batches are sent one after another. If a batch fails, its error is raised and the later batches are
+        not sent. `AsyncZohoApi.patch_records` instead sends every batch and returns the errors in its result list.
+
+        Args:
+            moduleName (str): The name of the Zoho CRM module.
+            records (list): The data to update, one dict per record. Each dict must contain the record's `id`.
+            token (str, optional): Authorization token.
+
+        Returns:
+            list[requests.Response]: The response object of each batch, in order.
+
+        Raises:
+            requests.RequestException: If a batch fails. Earlier batches have already been applied.
+        """
+        url = self._module_url(moduleName)
+        records = iter(records)
+        chunks = iter(lambda: list(islice(records, MAX_RECORDS_PER_REQUEST)), [])
+        return [self._make_request("PATCH", url, json={"data": chunk}, token=token) for chunk in chunks]
+
     def delete_record(self, moduleName: str, id: str, token: str = None) -> requests.Response:
         """
         Deletes a specific record in the specified Zoho CRM module.
@@ -144,7 +309,7 @@ class ZohoApi():
         Returns:
             requests.Response: The response object.
         """
-        url = f"{self.base_url}/{moduleName}/{id}"
+        url = f"{self._module_url(moduleName)}/{id}"
         return self._make_request("DELETE", url, token=token)
 
     def attach_file(self, moduleName: str, record_id: str, file_path: str = None, file_url: str = None, token: str = None) -> requests.Response:
@@ -164,12 +329,13 @@ class ZohoApi():
         Raises:
             ValueError: If neither file_path nor file_url is provided.
         """
-        url = f"{self.base_url}/{moduleName}/{record_id}/Attachments"
+        url = self._attachments_url(moduleName, record_id)
         
         if file_path:
             with open(file_path, "rb") as f:
-                files = {"file": f}
-                return self._make_request("POST", url, files=files, token=token)
+                # Stream the multipart body from the file handle instead of building it in memory
+                encoder = MultipartEncoder(fields={"file": (os.path.basename(file_path), f, "application/octet-stream")})
+                return self._make_request("POST", url, data=encoder, token=token, headers={"Content-Type": encoder.content_type})
         elif file_url:
             data = {"attachmentUrl": file_url}
             return self._make_request("POST", url, data=data, token=token)
@@ -203,19 +369,7 @@ class ZohoApi():
             - To fetch a specific file attachment for a record:
                 fetch_file('Leads', '12345', file_id='67890', fetch_all=False)
         """
-        if not record_id:
-            raise ValueError("record_id is required.")
-        
-        if not token:
-            raise ValueError("token is required.")
-
-        if fetch_all:
-            url = f"{self.base_url}/{moduleName}/{record_id}/Attachments"
-        else:
-            if not file_id:
-                raise ValueError("file_id must be provided when fetch_all is False.")
-            url = f"{self.base_url}/{moduleName}/{record_id}/Attachments/{file_id}"
-
+        url = self._fetch_file_url(moduleName, record_id, file_id, token, fetch_all)
         return self._make_request("GET", url, token=token)
     
     def fetch_related_list(self, moduleName: str, record_id: str, token: str, name : str) -> requests.Response:
@@ -232,20 +386,10 @@ class ZohoApi():
             requests.Response: The response object containing the related list data.
 
         Raises:
-            ValueError: If `record_id` is not provided, `token` is not provided, or `name` is not provided.
+            ValueError: If `record_id` is not provided, neither `token` nor a token manager is available, or `name` is not provided.
 
         """
-        if not record_id:
-            raise ValueError("record_id is required.")
-
-        if not token:
-            raise ValueError("token is required.")
-        
-        if not name:
-            raise ValueError("name is required.")
-        
-        url = f"{self.base_url}/{moduleName}/{record_id}/{name}"
-
+        url = self._related_list_url(moduleName, record_id, token, name)
         return self._make_request("GET", url, token=token)
 
 
@@ -270,7 +414,7 @@ class ZohoApi():
         """
         params = {"criteria": query}
 
-        return self._make_request("GET", f"{self.base_url}/{moduleName}/search", params=params, token=token)
+        return self._make_request("GET", f"{self._module_url(moduleName)}/search", params=params, token=token)
     
 
     def mass_update(self, moduleName: str, data: dict, token: str = None) -> requests.Response:
@@ -287,4 +431,4 @@ class ZohoApi():
             requests.Response: The response object containing the result of the mass update operation.
         """
 
-        return self._make_request("PUT", f"{self.base_url}/{moduleName}", json=data, token=token)
+        return self._make_request("PUT", self._module_url(moduleName), json=data, token=token)
@@ -0,0 +1,366 @@
+import os
+import asyncio
+import aiohttp
+from itertools import islice
+from typing import Literal
+from .utils import *
+from .api import MAX_RECORDS_PER_REQUEST, _ZohoApiBase
+from .rate_limiter import RateLimiter, RETRY_STATUS_CODES
+from .token_manager import TokenManager
+
+class AsyncZohoApi(_ZohoApiBase):
+    """
+    An asyncio counterpart of `ZohoApi` built on `aiohttp`. All requests share one `aiohttp.ClientSession`,
+    so many operations can run concurrently with `asyncio.gather` over a single connection pool.
+
+    The methods return the decoded JSON body of the response instead of a response object. Use the
+    instance as an async context manager, or call `aclose()` when done.
+
+    Attributes:
+        base_url (str): The base URL for the Zoho CRM API.
+        logger (logging.Logger): Logger instance for logging API events and errors.
+        rate_limiter (RateLimiter): The throttle applied to every request.
+        token_manager (TokenManager): Supplies the access token for calls made without an explicit `token`.
+        limit (int): The maximum number of open connections.
+        limit_per_host (int): The maximum number of open connections to the Zoho host, also used as the
+            number of batches sent concurrently by `bulk_create` and `patch_records`.
+    """
+
+    def __init__(self, base_url: str, rate_limiter: RateLimiter = None, token_manager: TokenManager = None, limit: int = 50, limit_per_host: int = 20) -> None:
+        """
+        Initializes the AsyncZohoApi class with the given base URL.
+
+        Args:
+            base_url (str): The base URL of the Zoho CRM API.
+            rate_limiter (RateLimiter, optional): The throttle to use. Defaults to a `RateLimiter` that only reacts to throttled responses.
+            token_manager (TokenManager, optional): The token source for calls made without a `token`. Pass the
+                same instance, e.g. from `get_token_manager`, to every client so they share one token.
+            limit (int, optional): The maximum number of open connections.
+            limit_per_host (int, optional): The maximum number of open connections to the Zoho host.
+        """
+        super().__init__(base_url, rate_limiter, token_manager)
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self._session = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Returns the shared client session, creating it on first use.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.limit, limit_per_host=self.limit_per_host, ttl_dns_cache=300)
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        """
+        Closes the underlying client session and releases pooled connections.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "AsyncZohoApi":
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def _make_request(self, method: Literal["GET", "POST", "PUT", "DELETE", "PATCH"], url: str, json=None, data=None, params=None, token=None, raw: bool = False):
+        """
+        Makes an HTTP request to the Zoho CRM API.
+
+        The request waits for the rate limiter before it is sent. If the API answers with 429 or 503, the
+        request is retried after the Retry-After delay or an exponential backoff, up to
+        `rate_limiter.max_attempts` attempts. Form data bodies are sent only once, since they cannot be replayed.
+
+        Args:
+            method (Literal): The HTTP method (e.g., GET, POST, PUT, DELETE, PATCH).
+            url (str): The full API endpoint URL.
+            json (dict, optional): The JSON payload for the request, serialized with orjson when available.
+            data (optional): The form payload for the request.
+            params (dict, optional): The query parameters.
+            token (str, optional): Authorization token. Defaults to the token manager's current token.
+            raw (bool, optional): If True, return the response body as bytes instead of decoding it as JSON.
+
+        Returns:
+            dict | bytes | None: The decoded JSON body, the raw body if `raw` is True, or None for an empty body.
+
+        Raises:
+            aiohttp.ClientError: If an HTTP error occurs.
+            Exception: For any unexpected errors.
+        """
+        try:
+            session = await self._get_session()
+            if not token and self.token_manager is not None:
+                token = await self.token_manager.get_access_token_async()
+            if json is not None and data is None:
+                data, json = json_dumps(json), None
+                headers = get_json_header(token)
+            else:
+                headers = get_header(token=token)
+            max_attempts = self.rate_limiter.max_attempts if not isinstance(data, aiohttp.FormData) else 1
+            for attempt in range(max_attempts):
+                await self.rate_limiter.acquire_async()
+                released = False
+                try:
+                    async with session.request(method, url, headers=headers, json=json, data=data, params=params) as response:
+                        self.rate_limiter.release(response.status, response.headers)
+                        released = True
+                        if response.status in RETRY_STATUS_CODES and attempt < max_attempts - 1:
+                            delay = self.rate_limiter.backoff_delay(attempt, response.headers.get("Retry-After"))
+                        else:
+                            response.raise_for_status()
+                            if raw:
+                                return await response.read()
+                            return await response.json(content_type=None)
+                finally:
+                    if not released:
+                        self.rate_limiter.release()
+                self.logger.warning(f"Request throttled with status {response.status}, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+        except aiohttp.ClientError as e:
+            self.logger.error(f"HTTP error occurred: {e}")
+            raise
+        except Exception as e:
+            self.logger.error(f"Unexpected error: {e}")
+            raise
+
+    async def _gather_batches(self, request, records: list) -> list:
+        """
+        Sends records in batches of up to 100, with at most `limit_per_host` batches in flight.
+
+        Args:
+            request (Callable): A coroutine function taking one batch payload.
+            records (list): The records to send.
+
+        Returns:
+            list: The result of each batch in order, or the exception it raised.
+        """
+        semaphore = asyncio.Semaphore(self.limit_per_host)
+
+        async def send(chunk):
+            async with semaphore:
+                return await request({"data": chunk})
+
+        records = iter(records)
+        chunks = iter(lambda: list(islice(records, MAX_RECORDS_PER_REQUEST)), [])
+        return await asyncio.gather(*(send(chunk) for chunk in chunks), return_exceptions=True)
+
+    async def create_record(self, moduleName: str, data: dict, token: str = None):
+        """
+        Creates a new record in the specified Zoho CRM module.
+
+        Args:
+            moduleName (str): The name of the Zoho CRM module.
+            data (dict): The record data to be created.
+            token (str, optional): Authorization token.
+
+        Returns:
+            dict: The response body.
+        """
+        return await self._make_request("POST", self._module_url(moduleName), json=data, token=token)
+
+    async def bulk_create(self, moduleName: str, records: list, token: str = None) -> list:
+        """
+        Creates many records in the specified Zoho CRM module, sending batches of up to 100 records concurrently.
+
+        Args:
+            moduleName (str): The name of the Zoho CRM module.
+            records (list): The record data to be created, one dict per record.
+            token (str, optional): Authorization token.
+
+        Returns:
+            list: The response body of each batch in order, or the exception raised for it.
+        """
+        return await self._gather_batches(lambda payload: self.create_record(moduleName, payload, token=token), records)
+
+    async def read_record(self, moduleName: str, id: str = None, token: str = None):
+        """
+        Reads records or a specific record from the specified Zoho CRM module.
+
+        Args:
+            moduleName (str): The name of the Zoho CRM module.
+            id (str, optional): The record ID. If None, fetches all records.
+            token (str, optional): Authorization token.
+
+        Returns:
+            dict: The response body.
+        """
+        module_url = self._module_url(moduleName)
+        url = f"{module_url}/{id}" if id else module_url
+        return await self._make_request("GET", url, token=token)
+
+    async def fetch_module_data(self, moduleName: str, token: str = None):
+        """
+        Fetches data from a specified module.
+
+        Args:
+            moduleName (str): The name of the Zoho CRM module.
+            token (str, optional): Authorization token.
+
+        Returns:
+            dict: The response body.
+        """
+        return await self._make_request("GET", self._module_url(moduleName), token=token)
+
+    async def update_record(self, moduleName: str, id: str, data: dict, token: str = None):
+        """
+        Updates a specific record in the specified Zoho CRM module.
+
+        Args:
+            moduleName (str): The name of the Zoho CRM module.
+            id (str): The record ID to update.
+            data (dict): The updated record data.
+            token (str, optional): Authorization token.
+
+        Returns:
+            dict: The response body.
+        """
+        return await self._make_request("PUT", f"{self._module_url(moduleName)}/{id}", json=data, token=token)
+
+    async def patch_record(self, moduleName: str, id: str, data: dict, token: str = None):
+        """
+        Partially updates a specific record in the specified Zoho CRM module.
+
+        Args:
+            moduleName (str): The name of the Zoho CRM module.
+            id (str): The record ID to update.
+            data (dict): The data to update.
+            token (str, optional): Authorization token.
+
+        Returns:
+            dict: The response body.
+        """
+        return await self._make_request("PATCH", f"{self._module_url(moduleName)}/{id}", json={"data": [data]}, token=token)
+
+    async def patch_records(self, moduleName: str, records: list, token: str = None) -> list:
+        """
+        Partially updates multiple records in the specified Zoho CRM module, sending batches of up to 100
+        records concurrently.
+
+        Args:
+            moduleName (str): The name of the Zoho CRM module.
+            records (list): The data to update, one dict per record. Each dict must contain the record's `id`.
+            token (str, optional): Authorization token.
+
+        Returns:
+            list: The response body of each batch in order, or the exception raised for it.
+        """
+        url = self._module_url(moduleName)
+        return await self._gather_batches(lambda payload: self._make_request("PATCH", url, json=payload, token=token), records)
+
+    async def delete_record(self, moduleName: str, id: str, token: str = None):
+        """
+        Deletes a specific record in the specified Zoho CRM module.
+
+        Args:
+            moduleName (str): The name of the Zoho CRM module.
+            id (str): The record ID to delete.
+            token (str, optional): Authorization token.
+
+        Returns:
+            dict: The response body.
+        """
+        return await self._make_request("DELETE", f"{self._module_url(moduleName)}/{id}", token=token)
+
+    async def attach_file(self, moduleName: str, record_id: str, file_path: str = None, file_url: str = None, token: str = None):
+        """
+        Attaches a file to a specific record in the specified Zoho CRM module.
+
+        Args:
+            moduleName (str): The name of the Zoho CRM module.
+            record_id (str): The record ID to attach the file to.
+            file_path (str, optional): The path to the local file to attach.
+            file_url (str, optional): The URL of the file to attach.
+            token (str, optional): Authorization token.
+
+        Returns:
+            dict: The response body.
+
+        Raises:
+            ValueError: If neither file_path nor file_url is provided.
+        """
+        url = self._attachments_url(moduleName, record_id)
+
+        if file_path:
+            with open(file_path, "rb") as f:
+                # aiohttp streams file objects in form data instead of reading them into memory
+                form = aiohttp.FormData()
+                form.add_field("file", f, filename=os.path.basename(file_path), content_type="application/octet-stream")
+                return await self._make_request("POST", url, data=form, token=token)
+        elif file_url:
+            return await self._make_request("POST", url, data={"attachmentUrl": file_url}, token=token)
+        else:
+            raise ValueError("Either file_path or file_url must be provided.")
+
+    async def fetch_file(self, moduleName: str, record_id: str, file_id: str = None, token: str = None, fetch_all: bool = True):
+        """
+        Fetches file attachments from a specific record in the specified Zoho CRM module.
+
+        Args:
+            moduleName (str): The name of the Zoho CRM module.
+            record_id (str): The record ID for which attachments are to be fetched.
+            file_id (str, optional): The specific file ID to fetch. Required if `fetch_all` is set to False.
+            token (str, optional): Authorization token.
+            fetch_all (bool, optional): If True, fetch all attachments for the given record. If False, fetch a specific file attachment. Defaults to True.
+
+        Returns:
+            dict | bytes: The attachment list, or the file content if `fetch_all` is False.
+
+        Raises:
+            ValueError: If `file_id` is not provided when `fetch_all` is False, or if `record_id` is not provided.
+        """
+        url = self._fetch_file_url(moduleName, record_id, file_id, token, fetch_all)
+        return await self._make_request("GET", url, token=token, raw=not fetch_all)
+
+    async def fetch_related_list(self, moduleName: str, record_id: str, token: str, name: str):
+        """
+        Fetches related list data from a specific record in the specified Zoho CRM module.
+
+        Args:
+            moduleName (str): The name of the Zoho CRM module.
+            record_id (str): The record ID for which related list data is to be fetched.
+            token (str): Authorization token.
+            name (str): The name of the related list to fetch.
+
+        Returns:
+            dict: The response body.
+
+        Raises:
+            ValueError: If `record_id` is not provided, neither `token` nor a token manager is available, or `name` is not provided.
+        """
+        url = self._related_list_url(moduleName, record_id, token, name)
+        return await self._make_request("GET", url, token=token)
+
+    async def search_record(self, moduleName: str, query: str, token: str = None):
+        """
+        Searches for records in a specified Zoho CRM module based on a given query.
+
+        Args:
+            moduleName (str): The name of the Zoho CRM module.
+            query (str): The search query.
+            token (str, optional): Authorization token.
+
+        Returns:
+            dict: The response body containing the search results.
+        """
+        params = {"criteria": query}
+
+        return await self._make_request("GET", f"{self._module_url(moduleName)}/search", params=params, token=token)
+
+    async def mass_update(self, moduleName: str, data: dict, token: str = None):
+        """
+        Performs a mass update on records within the specified Zoho CRM module.
+
+        Args:
+            moduleName (str): The name of the Zoho CRM module.
+            data (dict): The data for the records to be updated.
+            token (str, optional): Authorization token.
+
+        Returns:
+            dict: The response body containing the result of the mass update operation.
+        """
+        return await self._make_request("PUT", self._module_url(moduleName), json=data, token=token)
@@ -0,0 +1,175 @@
+#pyzohocrm/rate_limiter.py
+
+import math
+import time
+import asyncio
+import threading
+from collections import deque
+from email.utils import parsedate_to_datetime
+
+RETRY_STATUS_CODES = (429, 503)
+
+
+class RateLimiter:
+    """
+    A client-side throttle for Zoho CRM API requests.
+
+    By default the limiter only reacts to the API: it pauses all callers for the Retry-After delay of a
+    throttled response or when the `X-RATELIMIT-*` headers report that the quota is nearly used up, and
+    cuts the number of concurrent requests in half on each throttled response (AIMD, additive increase
+    and multiplicative decrease). A sliding one-minute request window and a fixed concurrency cap are
+    opt-in.
+
+    Attributes:
+        requests_per_minute (int): The maximum number of requests started in any 60 second window, or None for no window.
+        max_concurrency (int): The upper bound for the number of requests in flight, or None for no fixed bound.
+        min_concurrency (int): The lower bound the concurrency limit is cut down to on throttling.
+        max_attempts (int): The maximum number of attempts for a throttled request.
+        backoff_base (float): The delay in seconds before the first retry.
+        backoff_factor (float): The multiplier applied to the delay on each further retry.
+
+    Methods:
+        acquire(): Blocks until a request may be started.
+
+        acquire_async(): Waits without blocking the event loop until a request may be started.
+
+        release(): Marks a request as finished and adapts the limits to its response.
+
+        backoff_delay(): Returns the delay before retrying a throttled request.
+    """
+
+    def __init__(self, requests_per_minute: int = None, max_concurrency: int = None, min_concurrency: int = 1,
+                 max_attempts: int = 3, backoff_base: float = 1.0, backoff_factor: float = 2.0) -> None:
+        self.requests_per_minute = requests_per_minute
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_factor = backoff_factor
+        self._window = deque()
+        self._concurrency = math.inf if max_concurrency is None else float(max_concurrency)
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._condition = threading.Condition()
+
+    def _try_acquire(self):
+        """
+        Takes a request slot if one is free. Must be called with the condition held.
+
+        Returns:
+            float | None: 0 if a slot was taken, the number of seconds to wait before trying again,
+            or None if the caller has to wait for a running request to finish.
+        """
+        now = time.monotonic()
+        if self._paused_until > now:
+            return self._paused_until - now
+        if self.requests_per_minute is not None:
+            while self._window and now - self._window[0] >= 60:
+                self._window.popleft()
+            if len(self._window) >= self.requests_per_minute:
+                return 60 - (now - self._window[0])
+        if self._in_flight + 1 > self._concurrency:
+            return None
+        self._in_flight += 1
+        if self.requests_per_minute is not None:
+            self._window.append(now)
+        return 0
+
+    def acquire(self) -> None:
+        """Blocks until the rate and concurrency limits allow another request to start."""
+        with self._condition:
+            while True:
+                delay = self._try_acquire()
+                if delay == 0:
+                    return
+                self._condition.wait(delay)
+
+    async def acquire_async(self) -> None:
+        """Waits until the rate and concurrency limits allow another request to start, without blocking the event loop."""
+        while True:
+            with self._condition:
+                delay = self._try_acquire()
+            if delay == 0:
+                return
+            # Coroutines cannot wait on the condition, so poll while other requests are in flight
+            await asyncio.sleep(0.05 if delay is None else delay)
+
+    def release(self, status_code: int = None, headers=None) -> None:
+        """
+        Marks a request as finished and updates the limits from its response.
+
+        Args:
+            status_code (int, optional): The response status code, or None if the request failed without a response.
+            headers (optional): The response headers.
+        """
+        with self._condition:
+            self._in_flight -= 1
+            if status_code is not None:
+                self._update(status_code, headers or {})
+            self._condition.notify_all()
+
+    def _update(self, status_code: int, headers) -> None:
+        """Applies the AIMD step and the header based pause for a response."""
+        if status_code in RETRY_STATUS_CODES:
+            # Without a fixed bound the limit may still be infinite, so halve what was actually in flight
+            current = min(self._concurrency, self._in_flight + 1)
+            self._concurrency = max(self.min_concurrency, current * 0.5)
+            retry_after = parse_retry_after(headers.get("Retry-After"))
+            if retry_after:
+                self._pause(retry_after)
+            return
+
+        upper = math.inf if self.max_concurrency is None else self.max_concurrency
+        self._concurrency = min(upper, self._concurrency + 0.5)
+        remaining = headers.get("X-RATELIMIT-REMAINING")
+        limit = headers.get("X-RATELIMIT-LIMIT")
+        try:
+            remaining, limit = int(remaining), int(limit)
+        except (TypeError, ValueError):
+            return
+        if limit > 0 and remaining < limit * 0.1:
+            reset = headers.get("X-RATELIMIT-RESET")
+            try:
+                # Zoho reports the reset time as epoch milliseconds
+                delay = int(reset) / 1000 - time.time()
+            except (TypeError, ValueError):
+                delay = 60 / self.requests_per_minute if self.requests_per_minute else 1.0
+            self._pause(min(max(delay, 0), 60))
+
+    def _pause(self, seconds: float) -> None:
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def backoff_delay(self, attempt: int, retry_after: str = None) -> float:
+        """
+        Returns the delay before retrying a throttled request.
+
+        Args:
+            attempt (int): The zero based number of the attempt that was throttled.
+            retry_after (str, optional): The value of the response's Retry-After header.
+
+        Returns:
+            float: The delay in seconds.
+        """
+        backoff = self.backoff_base * self.backoff_factor ** attempt
+        return max(backoff, parse_retry_after(retry_after) or 0)
+
+
+def parse_retry_after(value: str):
+    """Parses a Retry-After header given either in seconds or as an HTTP date.
+
+    Args:
+        value (str): The header value.
+
+    Returns:
+        float | None: The delay in seconds, or None if the value is missing or invalid.
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
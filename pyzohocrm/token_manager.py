@@ -1,9 +1,46 @@
 #pyzohobook/token_manager.py
 
-import json
+import time
+import asyncio
+import threading
 import requests
-from datetime import datetime, timedelta
 import os
+from types import MappingProxyType
+from .utils import json_dumps, json_loads
+
+_ZOHO_URLS = MappingProxyType({
+    "united states": "https://accounts.zoho.com/",
+    "europe": "https://accounts.zoho.eu/",
+    "india": "https://accounts.zoho.in/",
+    "australia": "https://accounts.zoho.com.au/",
+    "japan": "https://accounts.zoho.jp/",
+    "canada": "https://accounts.zohocloud.ca/",
+})
+
+class _TokenState:
+    """The token, expiry and refresh lock shared by all TokenManager instances using one token file."""
+
+    __slots__ = ("token", "expiry", "lock")
+
+    def __init__(self) -> None:
+        self.token = None
+        self.expiry = None
+        self.lock = threading.Lock()
+
+
+_token_states = {}
+_token_states_lock = threading.Lock()
+
+
+def _get_token_state(token_path: str) -> _TokenState:
+    """Returns the shared state for a token file, creating it on first use."""
+    key = os.path.abspath(token_path)
+    with _token_states_lock:
+        state = _token_states.get(key)
+        if state is None:
+            state = _token_states[key] = _TokenState()
+        return state
+
 
 class TokenManager:
     """
@@ -11,7 +48,9 @@ class TokenManager:
 
     Attributes:
         _token (str): The current access token.
-        _expiry (datetime): The expiration time of the current access token.
+        _expiry (float): The expiration time of the current access token, in epoch seconds.
+        _state (_TokenState): Holds the token, expiry and refresh lock, shared by all instances in the process
+            that use the same token file, so a refresh by one instance is seen by all of them.
 
     Methods:
         _refresh_token(): Refreshes the access token by calling the Zoho API.
@@ -20,6 +59,8 @@ class TokenManager:
 
         get_access_token(): Retrieves the current access token.
 
+        get_access_token_async(): Retrieves the current access token from a coroutine.
+
         _get_domain_url(): Retrieves the domain URL based on the domain name.
 
     Instance Variables:
@@ -30,8 +71,6 @@ class TokenManager:
         grant_type (str): The grant type for the Zoho Books API.
 
     """
-    _token = None
-    _expiry = None
 
     def __init__(self, domain_name: str, refresh_token: str, client_id: str, client_secret: str, grant_type: str, token_dir: str = "./", token_filename: str = "token.json") -> None:
         self.domain_url = self._get_domain_url(domain_name.lower())
@@ -40,51 +79,88 @@ class TokenManager:
         self.client_secret = client_secret
         self.grant_type = grant_type
         self.token_path = os.path.join(token_dir, token_filename)
-        self._load_token_from_file()
+        self._state = _get_token_state(self.token_path)
+        if self._token is None:
+            with self._state.lock:
+                if self._token is None:
+                    self._load_token_from_file()
+
+    @property
+    def _token(self) -> str:
+        return self._state.token
+
+    @_token.setter
+    def _token(self, value: str) -> None:
+        self._state.token = value
+
+    @property
+    def _expiry(self) -> float:
+        return self._state.expiry
+
+    @_expiry.setter
+    def _expiry(self, value: float) -> None:
+        self._state.expiry = value
 
     def _get_domain_url(self, domain_name) -> str:
-        zoho_urls = {
-            "united states": "https://accounts.zoho.com/",
-            "europe": "https://accounts.zoho.eu/",
-            "india": "https://accounts.zoho.in/",
-            "australia": "https://accounts.zoho.com.au/",
-            "japan": "https://accounts.zoho.jp/",
-            "canada": "https://accounts.zohocloud.ca/",
-        }
-        return zoho_urls[domain_name]
+        domain_url = _ZOHO_URLS.get(domain_name)
+        if domain_url is None:
+            raise ValueError(f"Unknown domain {domain_name!r}, expected one of: {', '.join(_ZOHO_URLS)}")
+        return domain_url
 
     def _load_token_from_file(self) -> None:
-        """Loads the token and expiry from the token file if it exists."""
-        if os.path.exists(self.token_path):
-            try:
-                with open(self.token_path, "r") as f:
-                    data = json.load(f)
-                    self._token = data.get("token")
-                    expiry_str = data.get("expiry")
-                    if expiry_str:
-                        self._expiry = datetime.strptime(expiry_str, "%Y-%m-%d %H:%M:%S")
-            except (json.JSONDecodeError, FileNotFoundError, KeyError):
-                # If the file is corrupted or missing data, reset token and expiry
-                self._token = None
-                self._expiry = None
+        """Loads the token and expiry from the token file if it exists.
+
+        Called from `__init__` while no token for this file is held in memory; afterwards the token is kept in
+        memory and written back on refresh.
+        """
+        try:
+            with open(self.token_path, "rb") as f:
+                data = json_loads(f.read())
+                self._token = data.get("token")
+                expiry = data.get("expiry")
+                # Token files written by older versions store the expiry as a date string; treat those as expired
+                self._expiry = float(expiry) if isinstance(expiry, (int, float)) else None
+        except FileNotFoundError:
+            pass
+        except (ValueError, KeyError, AttributeError):
+            # If the file is corrupted or missing data, reset token and expiry
+            self._token = None
+            self._expiry = None
 
     def _save_token_to_file(self) -> None:
         """Saves the current token and expiry to the token file."""
-        with open(self.token_path, "w") as f:
-            json.dump({
+        with open(self.token_path, "wb") as f:
+            f.write(json_dumps({
                 "token": self._token,
-                "expiry": self._expiry.strftime("%Y-%m-%d %H:%M:%S"),
-            }, f)
+                "expiry": self._expiry,
+            }))
+
+    def _ensure_token(self) -> None:
+        """Refreshes the access token if it is missing or expired, letting only one thread refresh at a time."""
+        if self._token is None or self._is_token_expired():
+            with self._state.lock:
+                # Another thread may have refreshed the token while this one waited for the lock
+                if self._token is None or self._is_token_expired():
+                    self._refresh_token()
 
     def get_access_token(self) -> str:
-        """Retrieves the current access token, refreshing it if necessary."""
+        """Retrieves the current access token, refreshing it if necessary. Does no file I/O unless a refresh is needed."""
+        self._ensure_token()
+        return self._token
+
+    async def get_access_token_async(self) -> str:
+        """Retrieves the current access token, refreshing it in a worker thread if necessary.
+
+        The refresh goes through the same lock as `get_access_token`, so concurrent coroutines, threads and
+        event loops wait for a single refresh instead of each starting their own.
+        """
         if self._token is None or self._is_token_expired():
-            self._refresh_token()
+            await asyncio.get_event_loop().run_in_executor(None, self._ensure_token)
         return self._token
 
     def _is_token_expired(self) -> bool:
         """Checks if the current access token is expired."""
-        return self._expiry is None or datetime.now() >= self._expiry
+        return self._expiry is None or time.time() >= self._expiry
 
     def _refresh_token(self) -> None:
         """Calls the Zoho API to refresh the token."""
@@ -98,7 +174,40 @@ class TokenManager:
         response = requests.post(url, params=params)
         if response.status_code == 200:
             self._token = response.json()["access_token"]
-            self._expiry = datetime.now() + timedelta(minutes=50)  # Update expiry time
+            self._expiry = time.time() + 50 * 60  # Update expiry time
             self._save_token_to_file()  # Save the new token and expiry to file
         else:
             raise Exception(f"Failed to refresh token: {response.status_code}, {response.text}")
+
+
+_token_managers = {}
+_token_managers_lock = threading.Lock()
+
+
+def get_token_manager(domain_name: str, refresh_token: str, client_id: str, client_secret: str, grant_type: str, token_dir: str = "./", token_filename: str = "token.json") -> TokenManager:
+    """Returns the process-wide TokenManager for the given credentials, creating it on first use.
+
+    Managers are keyed by domain, client ID and absolute token file path, so the same values passed
+    positionally or as keywords return the same instance.
+
+    Share the returned instance between API clients so they use one token and one refresh lock instead of
+    refreshing independently.
+
+    Args:
+        domain_name (str): The Zoho data center, e.g. "United States" or "Canada".
+        refresh_token (str): The refresh token for the Zoho API.
+        client_id (str): The client ID for the Zoho API.
+        client_secret (str): The client secret for the Zoho API.
+        grant_type (str): The grant type for the Zoho API.
+        token_dir (str, optional): The directory of the token file.
+        token_filename (str, optional): The name of the token file.
+
+    Returns:
+        TokenManager: The shared token manager.
+    """
+    key = (domain_name.lower(), client_id, os.path.abspath(os.path.join(token_dir, token_filename)))
+    with _token_managers_lock:
+        token_manager = _token_managers.get(key)
+        if token_manager is None:
+            token_manager = _token_managers[key] = TokenManager(domain_name, refresh_token, client_id, client_secret, grant_type, token_dir, token_filename)
+        return token_manager
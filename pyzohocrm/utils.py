@@ -1,6 +1,31 @@
+import json
+from functools import lru_cache
 
+__all__ = ["get_header", "get_json_header", "json_dumps", "json_loads"]
 
+try:
+    import orjson
 
+    json_loads = orjson.loads
+
+    def json_dumps(obj) -> bytes:
+        """Serializes an object to UTF-8 encoded JSON with orjson, falling back to stdlib json for
+        values orjson rejects, such as integers wider than 64 bits. Like requests, the fallback raises
+        ValueError for NaN and infinity instead of emitting invalid JSON."""
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            return json.dumps(obj, allow_nan=False).encode()
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj) -> bytes:
+        """Serializes an object to UTF-8 encoded JSON, matching `orjson.dumps`. Raises ValueError for NaN and
+        infinity, as requests does."""
+        return json.dumps(obj, allow_nan=False).encode()
+
+
+@lru_cache(maxsize=16)
 def get_header(token : str ) -> dict:
     """Returns the headers for the Zoho API request.
 
@@ -8,8 +33,26 @@ def get_header(token : str ) -> dict:
         token (str): The access token for the Zoho API.
 
     Returns:
-        dict: The headers for the Zoho API request.
+        dict: The headers for the Zoho API request. The dict is cached per token and shared
+        between calls, so it must not be mutated.
     """
     return {
         "Authorization": f"Zoho-oauthtoken {token}"
-    }
\ No newline at end of file
+    }
+
+
+@lru_cache(maxsize=16)
+def get_json_header(token: str) -> dict:
+    """Returns the headers for a Zoho API request with a JSON body.
+
+    Args:
+        token (str): The access token for the Zoho API.
+
+    Returns:
+        dict: The authorization headers plus the JSON content type. Cached like `get_header`, so it must
+        not be mutated.
+    """
+    return {
+        **get_header(token),
+        "Content-Type": "application/json"
+    }
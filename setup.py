@@ -8,7 +8,11 @@ setup(
     author_email="rahul.work.programming@gmail.com",
     url="https://github.com/rahul-08-11/pyzohocrm",
     packages=find_packages(),
-    install_requires=[],  # Add dependencies if needed
+    install_requires=[
+        "requests",
+        "requests-toolbelt",
+        "aiohttp",
+    ],
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -0,0 +1,54 @@
+import json
+import unittest
+from unittest import mock
+
+import requests
+
+from pyzohocrm import ZohoApi
+
+
+def fake_response(status_code: int) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    return response
+
+
+class TestPatchRecords(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.api = ZohoApi("https://zoho.test/crm/v2")
+        self.addCleanup(self.api.close)
+        self.api._session = mock.Mock()
+        self.api._session.request.return_value = fake_response(200)
+
+    def sent_batches(self) -> list:
+        return [json.loads(call.kwargs["data"])["data"] for call in self.api._session.request.call_args_list]
+
+    def test_records_are_sent_in_batches_of_100(self):
+        records = [{"id": str(n), "First_Name": "John"} for n in range(250)]
+        responses = self.api.patch_records("Leads", records, token="token")
+
+        batches = self.sent_batches()
+        self.assertEqual([len(batch) for batch in batches], [100, 100, 50])
+        self.assertEqual([record for batch in batches for record in batch], records)
+        self.assertEqual(len(responses), 3)
+        for call in self.api._session.request.call_args_list:
+            self.assertEqual(call.args, ("PATCH", "https://zoho.test/crm/v2/Leads"))
+
+    def test_accepts_any_iterable(self):
+        self.api.patch_records("Leads", ({"id": str(n)} for n in range(100)), token="token")
+        self.assertEqual([len(batch) for batch in self.sent_batches()], [100])
+
+    def test_no_records_sends_nothing(self):
+        self.assertEqual(self.api.patch_records("Leads", [], token="token"), [])
+        self.api._session.request.assert_not_called()
+
+    def test_failing_batch_stops_later_batches(self):
+        self.api._session.request.side_effect = [fake_response(200), fake_response(400), fake_response(200)]
+        with self.assertRaises(requests.HTTPError):
+            self.api.patch_records("Leads", [{"id": str(n)} for n in range(250)], token="token")
+        self.assertEqual(self.api._session.request.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import asyncio
+import json
+import unittest
+from unittest import mock
+
+import aiohttp
+
+from pyzohocrm import AsyncZohoApi, RateLimiter
+
+
+class FakeResponse:
+
+    def __init__(self, status: int, body=None, headers=None) -> None:
+        self.status = status
+        self.headers = headers or {}
+        self._body = body
+
+    async def __aenter__(self) -> "FakeResponse":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        pass
+
+    def raise_for_status(self) -> None:
+        if self.status >= 400:
+            raise aiohttp.ClientResponseError(mock.Mock(real_url="https://zoho.test"), (), status=self.status)
+
+    async def json(self, content_type=None):
+        return self._body
+
+    async def read(self) -> bytes:
+        return json.dumps(self._body).encode()
+
+
+class FakeSession:
+    """Stands in for `aiohttp.ClientSession`, recording each request and answering it with `responder(data)`."""
+
+    closed = False
+
+    def __init__(self, responder) -> None:
+        self.responder = responder
+        self.requests = []
+
+    def request(self, method, url, headers=None, json=None, data=None, params=None):
+        self.requests.append({"method": method, "url": url, "data": data})
+        return self.responder(data)
+
+
+def statuses(*codes):
+    codes = iter(codes)
+    return lambda data: FakeResponse(next(codes), {"ok": True})
+
+
+class AsyncZohoApiTestCase(unittest.TestCase):
+
+    def make_api(self, responder) -> AsyncZohoApi:
+        api = AsyncZohoApi("https://zoho.test/crm/v2", rate_limiter=RateLimiter(backoff_base=0))
+        api._session = FakeSession(responder)
+        return api
+
+
+class TestMakeRequest(AsyncZohoApiTestCase):
+
+    def test_retries_throttled_requests(self):
+        api = self.make_api(statuses(429, 429, 200))
+        result = asyncio.run(api.read_record("Leads", token="token"))
+        self.assertEqual(result, {"ok": True})
+        self.assertEqual(len(api._session.requests), 3)
+        self.assertEqual(api.rate_limiter._in_flight, 0)
+
+    def test_gives_up_after_max_attempts(self):
+        api = self.make_api(statuses(429, 503, 429, 200))
+        with self.assertRaises(aiohttp.ClientResponseError):
+            asyncio.run(api.read_record("Leads", token="token"))
+        self.assertEqual(len(api._session.requests), 3)
+        self.assertEqual(api.rate_limiter._in_flight, 0)
+
+    def test_form_data_is_sent_once(self):
+        api = self.make_api(statuses(429, 200))
+        form = aiohttp.FormData()
+        form.add_field("file", b"content", filename="file.txt")
+        with self.assertRaises(aiohttp.ClientResponseError):
+            asyncio.run(api._make_request("POST", "https://zoho.test/crm/v2/Leads/1/Attachments", data=form, token="token"))
+        self.assertEqual(len(api._session.requests), 1)
+        self.assertEqual(api.rate_limiter._in_flight, 0)
+
+    def test_connection_error_releases_the_slot(self):
+        def fail(data):
+            raise aiohttp.ClientConnectionError("refused")
+
+        api = self.make_api(fail)
+        with self.assertRaises(aiohttp.ClientConnectionError):
+            asyncio.run(api.read_record("Leads", token="token"))
+        self.assertEqual(api.rate_limiter._in_flight, 0)
+
+
+class TestBatches(AsyncZohoApiTestCase):
+
+    def test_bulk_create_returns_one_result_per_chunk_in_order(self):
+        def respond(data):
+            chunk = json.loads(data)["data"]
+            # Fail the second chunk to check that its exception keeps its place
+            if chunk[0]["n"] == 100:
+                return FakeResponse(400)
+            return FakeResponse(201, {"first": chunk[0]["n"], "size": len(chunk)})
+
+        api = self.make_api(respond)
+        results = asyncio.run(api.bulk_create("Leads", [{"n": n} for n in range(250)], token="token"))
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0], {"first": 0, "size": 100})
+        self.assertIsInstance(results[1], aiohttp.ClientResponseError)
+        self.assertEqual(results[2], {"first": 200, "size": 50})
+        self.assertEqual(api.rate_limiter._in_flight, 0)
+
+    def test_bulk_create_without_records_sends_nothing(self):
+        api = self.make_api(statuses())
+        self.assertEqual(asyncio.run(api.bulk_create("Leads", [], token="token")), [])
+        self.assertEqual(api._session.requests, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,166 @@
+import unittest
+from unittest import mock
+
+from pyzohocrm.rate_limiter import RateLimiter, parse_retry_after
+
+
+class FakeClock:
+    """Stands in for the `time` module of the rate limiter, with both clocks advanced by hand."""
+
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class RateLimiterTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        patcher = mock.patch("pyzohocrm.rate_limiter.time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def take(self, limiter: RateLimiter):
+        with limiter._condition:
+            return limiter._try_acquire()
+
+
+class TestWindow(RateLimiterTestCase):
+
+    def test_no_window_by_default(self):
+        limiter = RateLimiter()
+        for _ in range(1000):
+            self.assertEqual(self.take(limiter), 0)
+            limiter.release(200, {})
+
+    def test_window_blocks_until_oldest_request_expires(self):
+        limiter = RateLimiter(requests_per_minute=2)
+        self.assertEqual(self.take(limiter), 0)
+        limiter.release(200, {})
+        self.clock.advance(10)
+        self.assertEqual(self.take(limiter), 0)
+        limiter.release(200, {})
+
+        self.assertEqual(self.take(limiter), 50)
+        self.clock.advance(50)
+        self.assertEqual(self.take(limiter), 0)
+
+
+class TestConcurrency(RateLimiterTestCase):
+
+    def test_unbounded_until_throttled(self):
+        limiter = RateLimiter()
+        for _ in range(8):
+            self.assertEqual(self.take(limiter), 0)
+        limiter.release(429, {})
+        # Seven requests are still running; the limit is half of the eight that were in flight
+        self.assertEqual(limiter._concurrency, 4)
+        self.assertIsNone(self.take(limiter))
+
+    def test_fixed_cap(self):
+        limiter = RateLimiter(max_concurrency=2)
+        self.assertEqual(self.take(limiter), 0)
+        self.assertEqual(self.take(limiter), 0)
+        self.assertIsNone(self.take(limiter))
+        limiter.release(200, {})
+        self.assertEqual(self.take(limiter), 0)
+
+    def test_additive_increase_up_to_cap(self):
+        limiter = RateLimiter(max_concurrency=4)
+        limiter._concurrency = 2.0
+        for expected in (2.5, 3.0, 3.5, 4.0, 4.0):
+            self.take(limiter)
+            limiter.release(200, {})
+            self.assertEqual(limiter._concurrency, expected)
+
+    def test_multiplicative_decrease_down_to_minimum(self):
+        limiter = RateLimiter(max_concurrency=8, min_concurrency=2)
+        for _ in range(8):
+            self.take(limiter)
+        for expected in (4.0, 2.0, 2.0):
+            limiter.release(503, {})
+            self.assertEqual(limiter._concurrency, expected)
+
+    def test_failed_request_leaves_limit_unchanged(self):
+        limiter = RateLimiter(max_concurrency=4)
+        self.take(limiter)
+        limiter.release()
+        self.assertEqual(limiter._concurrency, 4)
+        self.assertEqual(limiter._in_flight, 0)
+
+
+class TestPause(RateLimiterTestCase):
+
+    def test_retry_after_pauses_all_callers(self):
+        limiter = RateLimiter()
+        self.take(limiter)
+        limiter.release(429, {"Retry-After": "5"})
+        self.assertEqual(self.take(limiter), 5)
+        self.clock.advance(5)
+        self.assertEqual(self.take(limiter), 0)
+
+    def test_low_remaining_quota_pauses_until_reset(self):
+        limiter = RateLimiter()
+        self.take(limiter)
+        reset_ms = int((self.clock.now + 20) * 1000)
+        limiter.release(200, {"X-RATELIMIT-LIMIT": "100", "X-RATELIMIT-REMAINING": "9", "X-RATELIMIT-RESET": str(reset_ms)})
+        self.assertAlmostEqual(self.take(limiter), 20)
+
+    def test_pause_is_capped_at_a_minute(self):
+        limiter = RateLimiter()
+        self.take(limiter)
+        reset_ms = int((self.clock.now + 3600) * 1000)
+        limiter.release(200, {"X-RATELIMIT-LIMIT": "100", "X-RATELIMIT-REMAINING": "0", "X-RATELIMIT-RESET": str(reset_ms)})
+        self.assertAlmostEqual(self.take(limiter), 60)
+
+    def test_enough_remaining_quota_does_not_pause(self):
+        limiter = RateLimiter()
+        self.take(limiter)
+        limiter.release(200, {"X-RATELIMIT-LIMIT": "100", "X-RATELIMIT-REMAINING": "10"})
+        self.assertEqual(self.take(limiter), 0)
+
+    def test_invalid_headers_are_ignored(self):
+        limiter = RateLimiter()
+        self.take(limiter)
+        limiter.release(200, {"X-RATELIMIT-LIMIT": "many", "X-RATELIMIT-REMAINING": "0"})
+        self.assertEqual(self.take(limiter), 0)
+
+
+class TestBackoff(RateLimiterTestCase):
+
+    def test_exponential_backoff(self):
+        limiter = RateLimiter(backoff_base=1.0, backoff_factor=2.0)
+        self.assertEqual([limiter.backoff_delay(attempt) for attempt in range(3)], [1.0, 2.0, 4.0])
+
+    def test_retry_after_wins_when_longer(self):
+        limiter = RateLimiter()
+        self.assertEqual(limiter.backoff_delay(0, "7"), 7.0)
+        self.assertEqual(limiter.backoff_delay(2, "1"), 4.0)
+
+
+class TestParseRetryAfter(RateLimiterTestCase):
+
+    def test_seconds(self):
+        self.assertEqual(parse_retry_after("12"), 12.0)
+        self.assertEqual(parse_retry_after("-3"), 0.0)
+
+    def test_http_date(self):
+        self.clock.now = 1445412470.0  # Wed, 21 Oct 2015 07:27:50 GMT
+        self.assertEqual(parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 10.0)
+
+    def test_missing_or_invalid(self):
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after(""))
+        self.assertIsNone(parse_retry_after("soon"))
+
+
+if __name__ == "__main__":
+    unittest.main()
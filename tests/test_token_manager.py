@@ -0,0 +1,180 @@
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from pyzohocrm.token_manager import TokenManager, get_token_manager
+
+
+class FakeOAuth:
+    """Stands in for `requests.post` to the Zoho OAuth endpoint, counting calls and handing out numbered tokens."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, url, params=None):
+        with self._lock:
+            self.calls += 1
+            token = f"token-{self.calls}"
+        # Give other callers time to pile up on an expired token
+        time.sleep(self.delay)
+        response = mock.Mock(status_code=200)
+        response.json.return_value = {"access_token": token}
+        return response
+
+
+class TokenManagerTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.token_dir = tmp.name
+        self.oauth = FakeOAuth(delay=0.05)
+        patcher = mock.patch("pyzohocrm.token_manager.requests.post", self.oauth)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def make_manager(self, token_filename: str = "token.json") -> TokenManager:
+        return TokenManager("Canada", "refresh", "client", "secret", "refresh_token", self.token_dir, token_filename)
+
+
+class TestSingleflight(TokenManagerTestCase):
+
+    def test_threads_share_one_refresh(self):
+        manager = self.make_manager()
+        with ThreadPoolExecutor(20) as executor:
+            tokens = set(executor.map(lambda _: manager.get_access_token(), range(20)))
+        self.assertEqual(tokens, {"token-1"})
+        self.assertEqual(self.oauth.calls, 1)
+
+    def test_coroutines_share_one_refresh(self):
+        manager = self.make_manager()
+
+        async def fetch_all():
+            return await asyncio.gather(*(manager.get_access_token_async() for _ in range(20)))
+
+        self.assertEqual(set(asyncio.run(fetch_all())), {"token-1"})
+        self.assertEqual(self.oauth.calls, 1)
+
+    def test_async_refresh_across_event_loops(self):
+        manager = self.make_manager()
+
+        async def fetch_all():
+            return await asyncio.gather(*(manager.get_access_token_async() for _ in range(20)))
+
+        self.assertEqual(set(asyncio.run(fetch_all())), {"token-1"})
+        manager._expiry = 0
+        self.assertEqual(set(asyncio.run(fetch_all())), {"token-2"})
+        self.assertEqual(self.oauth.calls, 2)
+
+    def test_valid_token_is_not_refreshed(self):
+        manager = self.make_manager()
+        manager.get_access_token()
+        manager.get_access_token()
+        asyncio.run(manager.get_access_token_async())
+        self.assertEqual(self.oauth.calls, 1)
+
+
+class TestSharedState(TokenManagerTestCase):
+
+    def write_token_file(self, content: str, token_filename: str = "token.json") -> None:
+        with open(os.path.join(self.token_dir, token_filename), "w") as f:
+            f.write(content)
+
+    def test_managers_on_one_path_see_each_others_refresh(self):
+        first = self.make_manager()
+        second = self.make_manager()
+        self.assertEqual(first.get_access_token(), "token-1")
+        self.assertEqual(second._token, "token-1")
+        self.assertEqual(second.get_access_token(), "token-1")
+        self.assertEqual(self.oauth.calls, 1)
+
+    def test_managers_on_different_paths_are_independent(self):
+        first = self.make_manager("first.json")
+        second = self.make_manager("second.json")
+        first.get_access_token()
+        self.assertIsNone(second._token)
+        self.assertEqual(second.get_access_token(), "token-2")
+
+    def test_expired_token_refreshed_once_across_managers(self):
+        self.write_token_file(json.dumps({"token": "stale", "expiry": time.time() - 1}))
+        managers = [self.make_manager(), self.make_manager()]
+        with ThreadPoolExecutor(20) as executor:
+            tokens = set(executor.map(lambda i: managers[i % 2].get_access_token(), range(20)))
+        self.assertEqual(tokens, {"token-1"})
+        self.assertEqual(self.oauth.calls, 1)
+
+    def test_valid_token_file_is_used(self):
+        self.write_token_file(json.dumps({"token": "saved", "expiry": time.time() + 60}))
+        self.assertEqual(self.make_manager().get_access_token(), "saved")
+        self.assertEqual(self.oauth.calls, 0)
+
+    def test_refresh_writes_token_file(self):
+        self.make_manager().get_access_token()
+        with open(os.path.join(self.token_dir, "token.json")) as f:
+            data = json.load(f)
+        self.assertEqual(data["token"], "token-1")
+        self.assertIsInstance(data["expiry"], float)
+
+    def test_date_string_expiry_loads_as_expired(self):
+        self.write_token_file(json.dumps({"token": "old", "expiry": "2030-01-01 00:00:00"}))
+        manager = self.make_manager()
+        self.assertEqual(manager._token, "old")
+        self.assertIsNone(manager._expiry)
+        self.assertTrue(manager._is_token_expired())
+        self.assertEqual(manager.get_access_token(), "token-1")
+
+    def test_empty_token_file_loads_as_none(self):
+        self.write_token_file("")
+        manager = self.make_manager()
+        self.assertIsNone(manager._token)
+        self.assertIsNone(manager._expiry)
+
+    def test_list_token_file_loads_as_none(self):
+        self.write_token_file(json.dumps(["token", 123]))
+        manager = self.make_manager()
+        self.assertIsNone(manager._token)
+        self.assertIsNone(manager._expiry)
+
+    def test_missing_file_is_read_again_later(self):
+        self.assertIsNone(self.make_manager()._token)
+        self.write_token_file(json.dumps({"token": "written", "expiry": time.time() + 60}))
+        self.assertEqual(self.make_manager().get_access_token(), "written")
+        self.assertEqual(self.oauth.calls, 0)
+
+
+class TestGetTokenManager(TokenManagerTestCase):
+
+    def test_positional_and_keyword_calls_share_an_instance(self):
+        positional = get_token_manager("Canada", "refresh", "client", "secret", "refresh_token", self.token_dir)
+        keyword = get_token_manager(domain_name="canada", refresh_token="refresh", client_id="client",
+                                    client_secret="secret", grant_type="refresh_token",
+                                    token_dir=os.path.join(self.token_dir, ""), token_filename="token.json")
+        self.assertIs(positional, keyword)
+        positional.get_access_token()
+        keyword.get_access_token()
+        self.assertEqual(self.oauth.calls, 1)
+
+    def test_different_clients_get_different_instances(self):
+        first = get_token_manager("Canada", "refresh", "client-a", "secret", "refresh_token", self.token_dir, "a.json")
+        second = get_token_manager("Canada", "refresh", "client-b", "secret", "refresh_token", self.token_dir, "b.json")
+        self.assertIsNot(first, second)
+
+    def test_concurrent_calls_create_one_instance(self):
+        with ThreadPoolExecutor(20) as executor:
+            managers = set(executor.map(
+                lambda _: get_token_manager("Canada", "refresh", "client", "secret", "refresh_token", self.token_dir),
+                range(20),
+            ))
+        self.assertEqual(len(managers), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
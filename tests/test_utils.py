@@ -0,0 +1,58 @@
+import importlib
+import importlib.util
+import json
+import sys
+import unittest
+from unittest import mock
+
+from pyzohocrm import utils
+
+
+class JsonDumpsChecks:
+    """Checks `json_dumps` against stdlib json for the payloads requests used to accept."""
+
+    def assertSameJson(self, payload) -> None:
+        self.assertEqual(json.loads(self.dumps(payload)), json.loads(json.dumps(payload)))
+
+    def test_plain_payload(self):
+        self.assertSameJson({"data": [{"Last_Name": "Doe", "Amount": 12.5, "Active": True, "Owner": None}]})
+
+    def test_non_str_keys(self):
+        self.assertEqual(json.loads(self.dumps({1: "a", "b": 2})), {"1": "a", "b": 2})
+
+    def test_int_wider_than_64_bits(self):
+        self.assertSameJson({"id": 2 ** 70})
+
+    def test_nan_raises_when_falling_back(self):
+        with self.assertRaises(ValueError):
+            self.dumps({"id": 2 ** 70, "f": float("nan")})
+
+    def test_returns_bytes(self):
+        self.assertIsInstance(self.dumps({"a": 1}), bytes)
+
+
+@unittest.skipIf(importlib.util.find_spec("orjson") is None, "orjson is not installed")
+class TestJsonDumpsOrjson(JsonDumpsChecks, unittest.TestCase):
+
+    def dumps(self, payload) -> bytes:
+        return utils.json_dumps(payload)
+
+
+class TestJsonDumpsStdlib(JsonDumpsChecks, unittest.TestCase):
+
+    def setUp(self) -> None:
+        # Reload utils with orjson hidden to get the stdlib implementation
+        with mock.patch.dict(sys.modules, {"orjson": None}):
+            self.stdlib_utils = importlib.reload(utils)
+        self.addCleanup(importlib.reload, utils)
+
+    def dumps(self, payload) -> bytes:
+        return self.stdlib_utils.json_dumps(payload)
+
+    def test_nan_raises(self):
+        with self.assertRaises(ValueError):
+            self.dumps({"f": float("nan")})
+
+
+if __name__ == "__main__":
+    unittest.main()